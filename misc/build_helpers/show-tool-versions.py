@@ -17,8 +17,13 @@ def print_platform():
         out = platform.platform()
         print("platform:", foldlines(out))
         print("machine: ", platform.machine())
-        if hasattr(platform, 'linux_distribution'):
-            print("linux_distribution:", repr(platform.linux_distribution()))
+        if hasattr(platform, 'freedesktop_os_release'):
+            try:
+                os_release = platform.freedesktop_os_release()
+            except OSError:
+                pass
+            else:
+                print("os_release:", repr((os_release.get("ID"), os_release.get("VERSION_ID"))))
     except EnvironmentError:
         sys.stderr.write("\nGot exception using 'platform'. Exception follows\n")
         traceback.print_exc(file=sys.stderr)
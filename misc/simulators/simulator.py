@@ -4,8 +4,6 @@
 import hashlib
 import os, random
 
-from pkg_resources import require
-require('PyRRD')
 from pyrrd import graph
 from pyrrd.rrd import DataSource, RRD, RRA
 
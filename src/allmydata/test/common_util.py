@@ -5,7 +5,6 @@ Ported to Python 3.
 import os
 import sys
 import time
-import signal
 from functools import (
     partial,
 )
@@ -237,26 +236,16 @@ class ReallyEqualMixin(object):
 
 
 class SignalMixin(object):
-    # This class is necessary for any code which wants to use Processes
-    # outside the usual reactor.run() environment. It is copied from
-    # Twisted's twisted.test.test_process . Note that Twisted-8.2.0 uses
-    # something rather different.
-    sigchldHandler = None
+    # This class used to install reactor._handleSigchld as the SIGCHLD
+    # handler, for code which wanted to use Processes outside the usual
+    # reactor.run() environment.  No supported version of Twisted has
+    # _handleSigchld any more: SIGCHLD is handled by the reactor itself (see
+    # _SIGCHLDWaker in twisted.internet._signals), so there is nothing left
+    # for this mixin to do.  It is kept so existing subclasses keep working.
 
     def setUp(self):
-        # make sure SIGCHLD handler is installed, as it should be on
-        # reactor.run(). problem is reactor may not have been run when this
-        # test runs.
-        if hasattr(reactor, "_handleSigchld") and hasattr(signal, "SIGCHLD"):
-            self.sigchldHandler = signal.signal(signal.SIGCHLD,
-                                                reactor._handleSigchld)
         return super(SignalMixin, self).setUp()
 
-    def tearDown(self):
-        if self.sigchldHandler:
-            signal.signal(signal.SIGCHLD, self.sigchldHandler)
-        return super(SignalMixin, self).tearDown()
-
 
 class StallMixin(object):
     def stall(self, res=None, delay=1):
@@ -5,7 +5,6 @@ Futz with files like a pro.
 """
 
 import sys, os, stat, tempfile, time, binascii
-import six
 from collections import namedtuple
 from errno import ENOENT
 
@@ -555,7 +554,7 @@ class UnableToUnlinkReplacementError(Exception):
 def reraise(wrapper):
     cls, exc, tb = sys.exc_info()
     wrapper_exc = wrapper("%s: %s" % (cls.__name__, exc))
-    six.reraise(wrapper, wrapper_exc, tb)
+    raise wrapper_exc.with_traceback(tb)
 
 
 if sys.platform == "win32":